@@ -3,13 +3,29 @@ from dataclasses import dataclass
 from typing import Any, Iterable, Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Вузол однозв'язного списку."""
     value: Any
     next: Optional["Node"] = None
 
 
+# Пул звільнених вузлів: clear() повертає сюди вузли, а _new_node() бере їх повторно,
+# щоб не створювати новий об'єкт для кожного значення.
+_NODE_POOL: List[Node] = []
+_NODE_POOL_MAX_SIZE = 1 << 16
+
+
+def _new_node(value: Any) -> Node:
+    """Взяти вузол із пулу (або створити новий) і записати в нього значення."""
+    if not _NODE_POOL:
+        return Node(value)
+    node = _NODE_POOL.pop()
+    node.value = value
+    node.next = None
+    return node
+
+
 class LinkedList:
     """Проста реалізація однозв'язного списку."""
 
@@ -18,20 +34,43 @@ class LinkedList:
         Створює порожній список або заповнює його значеннями з ітерабельного об'єкта.
         """
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
+        self._len = 0
         if values is not None:
             for v in values:
                 self.append(v)
 
     def append(self, value: Any) -> None:
-        """Додати елемент у кінець списку."""
-        new_node = Node(value)
-        if self.head is None:
+        """Додати елемент у кінець списку за O(1) завдяки вказівнику tail."""
+        new_node = _new_node(value)
+        self._len += 1
+        if self.tail is None:
             self.head = new_node
+            self.tail = new_node
             return
+        self.tail.next = new_node
+        self.tail = new_node
+
+    def __len__(self) -> int:
+        """Кількість елементів у списку."""
+        return self._len
+
+    def clear(self) -> None:
+        """
+        Очистити список і повернути його вузли в пул для повторного використання.
+        Після виклику вузли цього списку не можна використовувати зовні.
+        """
         current = self.head
-        while current.next is not None:
-            current = current.next
-        current.next = new_node
+        while current is not None:
+            nxt = current.next
+            if len(_NODE_POOL) < _NODE_POOL_MAX_SIZE:
+                current.value = None
+                current.next = None
+                _NODE_POOL.append(current)
+            current = nxt
+        self.head = None
+        self.tail = None
+        self._len = 0
 
     def to_list(self) -> List[Any]:
         """Повернути всі значення як звичайний список Python."""
@@ -46,6 +85,7 @@ class LinkedList:
         """Реверсувати список на місці, змінюючи посилання між вузлами."""
         prev: Optional[Node] = None
         current = self.head
+        self.tail = current  # колишня голова стає хвостом
         while current is not None:
             nxt = current.next
             current.next = prev
@@ -54,89 +94,66 @@ class LinkedList:
         self.head = prev
 
     def sort(self) -> None:
-        """Відсортувати список за допомогою merge sort."""
-        self.head = merge_sort_list(self.head)
+        """
+        Відсортувати список (стабільно, за неспаданням).
+
+        Значення разом із вузлами збираються у звичайний список Python і
+        сортуються вбудованим Timsort, після чого наявні вузли
+        перезв'язуються в новому порядку — нові вузли не створюються.
+        """
+        pairs: List[tuple[Any, Node]] = []
+        current = self.head
+        while current is not None:
+            pairs.append((current.value, current))
+            current = current.next
+        if not pairs:
+            return
+
+        pairs.sort(key=lambda pair: pair[0])
+
+        for (_, node), (_, nxt) in zip(pairs, pairs[1:]):
+            node.next = nxt
+        pairs[-1][1].next = None
+
+        self.head = pairs[0][1]
+        self.tail = pairs[-1][1]
 
     @staticmethod
     def merge_sorted(first: "LinkedList", second: "LinkedList") -> "LinkedList":
         """
         Об'єднати два ВЖЕ відсортовані списки у новий відсортований.
-        Вихідні списки не змінюються (робимо копію вузлів).
+        Вихідні списки не змінюються: з них лише читаються значення,
+        а вузли створюються тільки для результату й одразу зв'язуються між собою.
         """
-        new_head = merge_two_sorted_lists(copy_list(first.head), copy_list(second.head))
+        dummy = Node(None)  # фіктивна голова, щоб не перевіряти порожній результат у циклі
+        tail = dummy
+        l1, l2 = first.head, second.head
+
+        while l1 is not None and l2 is not None:
+            if l1.value <= l2.value:
+                node = _new_node(l1.value)
+                l1 = l1.next
+            else:
+                node = _new_node(l2.value)
+                l2 = l2.next
+            tail.next = node
+            tail = node
+
+        # Додати "хвіст" одного зі списків
+        rest = l1 if l1 is not None else l2
+        while rest is not None:
+            node = _new_node(rest.value)
+            tail.next = node
+            tail = node
+            rest = rest.next
+
         merged = LinkedList()
-        merged.head = new_head
+        merged.head = dummy.next
+        merged.tail = tail if tail is not dummy else None
+        merged._len = first._len + second._len
         return merged
 
 
-def copy_list(head: Optional[Node]) -> Optional[Node]:
-    """Створити глибоку копію однозв'язного списку, починаючи з head."""
-    if head is None:
-        return None
-    new_head = Node(head.value)
-    current_old = head.next
-    current_new = new_head
-    while current_old is not None:
-        current_new.next = Node(current_old.value)
-        current_new = current_new.next
-        current_old = current_old.next
-    return new_head
-
-
-def merge_two_sorted_lists(l1: Optional[Node], l2: Optional[Node]) -> Optional[Node]:
-    """
-    Змерджити два відсортовані за неспаданням списки у один відсортований.
-    Повертає head нового списку (вузли перевикористовуються).
-    """
-    dummy = Node(0)
-    tail = dummy
-
-    while l1 is not None and l2 is not None:
-        if l1.value <= l2.value:
-            tail.next = l1
-            l1 = l1.next
-        else:
-            tail.next = l2
-            l2 = l2.next
-        tail = tail.next
-
-    # Додати "хвіст" одного зі списків
-    tail.next = l1 if l1 is not None else l2
-    return dummy.next
-
-
-def split_list(head: Optional[Node]) -> tuple[Optional[Node], Optional[Node]]:
-    """
-    Розділити список на дві половини (для merge sort).
-    Повертає кортеж (ліва_половина_head, права_половина_head).
-    """
-    if head is None or head.next is None:
-        return head, None
-
-    slow = head
-    fast = head.next
-
-    while fast is not None and fast.next is not None:
-        slow = slow.next  # type: ignore[assignment]
-        fast = fast.next.next
-
-    middle = slow.next  # type: ignore[assignment]
-    slow.next = None  # type: ignore[assignment]
-
-    return head, middle
-
-
-def merge_sort_list(head: Optional[Node]) -> Optional[Node]:
-    """Merge sort для однозв'язного списку; повертає новий head."""
-    if head is None or head.next is None:
-        return head
-
-    left, right = split_list(head)
-    left_sorted = merge_sort_list(left)
-    right_sorted = merge_sort_list(right)
-    return merge_two_sorted_lists(left_sorted, right_sorted)
-
-
 def _demo_reverse_and_sort() -> None:
     """Невелика демонстрація реверсу та сортування."""
     print("=== Демонстрація реверсу та сортування ===")
@@ -167,22 +184,33 @@ def _run_simple_tests() -> None:
     ll = LinkedList([1, 2, 3])
     ll.reverse()
     assert ll.to_list() == [3, 2, 1], "Помилка в reverse"
+    ll.append(0)
+    assert ll.to_list() == [3, 2, 1, 0], "Помилка в append після reverse"
 
     # Тест сортування
     ll2 = LinkedList([4, 1, 5, 2, 3])
     ll2.sort()
     assert ll2.to_list() == [1, 2, 3, 4, 5], "Помилка в sort"
+    ll2.append(6)
+    assert ll2.to_list() == [1, 2, 3, 4, 5, 6], "Помилка в append після sort"
 
     # Тест merge двох відсортованих списків
     l1 = LinkedList([1, 3, 5])
     l2 = LinkedList([2, 4, 6])
     merged = LinkedList.merge_sorted(l1, l2)
     assert merged.to_list() == [1, 2, 3, 4, 5, 6], "Помилка в merge_sorted"
+    assert len(merged) == 6, "Помилка в довжині після merge_sorted"
 
     # Перевірка, що вихідні списки не змінені
     assert l1.to_list() == [1, 3, 5], "merge_sorted змінив перший список"
     assert l2.to_list() == [2, 4, 6], "merge_sorted змінив другий список"
 
+    # Тест clear та повторного використання вузлів
+    merged.clear()
+    assert merged.to_list() == [] and len(merged) == 0, "Помилка в clear"
+    ll3 = LinkedList([7, 8, 9])
+    assert ll3.to_list() == [7, 8, 9], "Помилка при повторному використанні вузлів"
+
     print("\n Всі внутрішні тести пройдено успішно ✅")
 
 
@@ -1,91 +1,110 @@
 from __future__ import annotations
 
-import math
 import sys
 from typing import Optional
 
 import matplotlib.pyplot as plt
-from matplotlib import patches
+import numpy as np
 from matplotlib import cm
+from matplotlib.collections import PolyCollection
 
 
-def draw_square(ax: plt.Axes, p0: complex, p1: complex, color: tuple[float, float, float, float]) -> None:
+def build_tree_squares(p0: complex, p1: complex, max_level: int) -> tuple[np.ndarray, np.ndarray]:
     """
-    Намалювати квадрат, заданий двома точками основи p0 та p1 (комплексні числа).
-    Квадрат будується як:
-        p0 -> p1 -> p2 -> p3 -> p0
-    де p2 та p3 отримуються поворотом вектора (p1 - p0) на 90 градусів.
+    Обчислює вершини всіх квадратів дерева Піфагора рівень за рівнем (без рекурсії).
+
+    Кожен квадрат задається двома точками основи (p0, p1) у вигляді комплексних чисел.
+    На кожному рівні всі основи обробляються одночасно векторними операціями NumPy:
+        p2, p3 – верхні точки квадрата (поворот вектора основи на 90° множенням на 1j),
+        apex   – вершина рівнобедреного прямокутного трикутника над верхньою стороною.
+    Основи дочірніх квадратів – відрізки [p2, apex] та [apex, p3].
+
+    Квадрати зберігаються в заздалегідь виділеному масиві у порядку бінарної купи:
+    рівень L займає індекси [2**L - 1, 2**(L + 1) - 1), а діти квадрата i – це 2i+1 та 2i+2.
+
+    :param p0: Ліва нижня точка кореневого квадрата (комплексне число).
+    :param p1: Права нижня точка кореневого квадрата (комплексне число).
+    :param max_level: Максимальний рівень рекурсії.
+    :return: Кортеж (verts, levels), де verts має форму (N, 4, 2) – координати вершин
+             p0 -> p1 -> p2 -> p3 для кожного квадрата, а levels – рівень кожного квадрата.
     """
-    v = p1 - p0  # вектор основи
-    # поворот на +90 градусів (множення на 1j у комплексній площині)
-    p2 = p1 + v * 1j
-    p3 = p0 + v * 1j
-
-    polygon = patches.Polygon(
-        [
-            (p0.real, p0.imag),
-            (p1.real, p1.imag),
-            (p2.real, p2.imag),
-            (p3.real, p3.imag),
-        ],
-        closed=True,
-        facecolor=color,
-        edgecolor="black",
-        linewidth=0.5,
-    )
-    ax.add_patch(polygon)
+    total = 2 ** (max_level + 1) - 1
+    corners = np.empty((total, 4), dtype=np.complex128)
+    levels = np.empty(total, dtype=np.int32)
+
+    b0 = np.array([p0], dtype=np.complex128)
+    b1 = np.array([p1], dtype=np.complex128)
+
+    for level in range(max_level + 1):
+        start = 2**level - 1
+        end = 2 * start + 1
+        square = corners[start:end]
+
+        square[:, 0] = b0
+        square[:, 1] = b1
+        v = b1 - b0
+        square[:, 2] = b1 + v * 1j
+        square[:, 3] = b0 + v * 1j
+        levels[start:end] = level
+
+        if level == max_level:
+            break
+
+        p2 = square[:, 2]
+        p3 = square[:, 3]
+        top = p3 - p2
+        apex = p2 + top / 2 + (top * 1j) / 2
+        # Діти чергуються: лівий [p2, apex], правий [apex, p3]
+        b0 = np.stack([p2, apex], axis=1).ravel()
+        b1 = np.stack([apex, p3], axis=1).ravel()
+
+    verts = np.stack([corners.real, corners.imag], axis=-1)
+    return verts, levels
 
 
 def draw_pythagoras_tree(
     ax: plt.Axes,
     p0: complex,
     p1: complex,
-    level: int,
     max_level: int,
+    palette: Optional[np.ndarray] = None,
 ) -> None:
     """
-    Рекурсивно малює фрактал «дерево Піфагора».
+    Малює фрактал «дерево Піфагора» однією колекцією полігонів.
 
     :param ax: Вісь matplotlib для малювання.
-    :param p0: Ліва нижня точка поточного квадрата (комплексне число).
-    :param p1: Права нижня точка поточного квадрата (комплексне число).
-    :param level: Поточний рівень рекурсії (0 для кореня).
+    :param p0: Ліва нижня точка кореневого квадрата (комплексне число).
+    :param p1: Права нижня точка кореневого квадрата (комплексне число).
     :param max_level: Максимальний рівень рекурсії.
+    :param palette: Масив RGBA-кольорів форми (max_level + 1, 4) – колір для кожного рівня.
+                    Якщо не задано – обчислюється через level_palette.
     """
-    # Нормалізований параметр для градієнта кольорів по глибині рекурсії
-    t = level / max_level if max_level > 0 else 0.0
-    # Використовуємо colormap viridis для «красоти» :)
-    color = cm.viridis(1.0 - t)  # ближче до кореня темніше, вище – світліше
-
-    # Намалювати поточний квадрат
-    draw_square(ax, p0, p1, color)
+    if palette is None:
+        palette = level_palette(max_level)
 
-    if level >= max_level:
-        return
+    verts, levels = build_tree_squares(p0, p1, max_level)
 
-    v = p1 - p0
-    # Верхні точки квадрата
-    p2 = p1 + v * 1j
-    p3 = p0 + v * 1j
-    top = p3 - p2  # вектор верхньої сторони
-
-    # Для класичного дерева Піфагора (рівнобедрений прямокутний трикутник):
-    # Обчислюємо вершину трикутника (apex) над верхньою стороною.
-    # Формула: apex = p2 + top/2 + (top * 1j) / 2
-    # Це дає симетричний варіант, де обидва дочірні квадрати однакового розміру.
-    apex = p2 + top / 2 + (top * 1j) / 2
+    collection = PolyCollection(
+        verts,
+        closed=True,
+        facecolors=palette[levels],
+        edgecolors="black",
+        linewidths=0.5,
+    )
+    ax.add_collection(collection)
 
-    # Лівий дочірній квадрат базується на відрізку [p2, apex]
-    left_p0 = p2
-    left_p1 = apex
 
-    # Правий дочірній квадрат базується на відрізку [apex, p3]
-    right_p0 = apex
-    right_p1 = p3
+def level_palette(max_level: int) -> np.ndarray:
+    """
+    Повертає кольори для рівнів 0..max_level одним викликом colormap.
 
-    # Рекурсивні виклики для двох дочірніх квадратів
-    draw_pythagoras_tree(ax, left_p0, left_p1, level + 1, max_level)
-    draw_pythagoras_tree(ax, right_p0, right_p1, level + 1, max_level)
+    :param max_level: Максимальний рівень рекурсії.
+    :return: Масив RGBA форми (max_level + 1, 4).
+    """
+    # Нормалізований параметр для градієнта кольорів по глибині рекурсії
+    t = np.linspace(0.0, 1.0, max_level + 1)
+    # Використовуємо colormap viridis для «красоти» :)
+    return cm.viridis(1.0 - t)  # ближче до кореня темніше, вище – світліше
 
 
 def build_and_show_tree(recursion_level: int, save_path: Optional[str] = None) -> None:
@@ -103,7 +122,8 @@ def build_and_show_tree(recursion_level: int, save_path: Optional[str] = None) -
     p0 = 0 + 0j
     p1 = base_length + 0j
 
-    draw_pythagoras_tree(ax, p0, p1, level=0, max_level=recursion_level)
+    palette = level_palette(recursion_level)
+    draw_pythagoras_tree(ax, p0, p1, max_level=recursion_level, palette=palette)
 
     ax.set_aspect("equal", "box")
     ax.axis("off")
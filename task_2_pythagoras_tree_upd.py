@@ -5,50 +5,72 @@ from typing import Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
 
 COLOR = "#8B0000"  # темно-червоний колір ліній, як у прикладі
 
 
-def draw_branch(
-    ax: plt.Axes,
+def build_branch_segments(
     x: float,
     y: float,
     length: float,
     angle: float,
     level: int,
-) -> None:
+) -> np.ndarray:
     """
-    Рекурсивно малює дерево Піфагора у вигляді ліній.
+    Обчислює відрізки всіх гілок дерева Піфагора рівень за рівнем (без рекурсії).
 
-    x, y    – початок гілки;
-    length  – довжина поточної гілки;
+    x, y    – початок першої гілки;
+    length  – довжина першої гілки;
     angle   – кут (у радіанах) від осі OX (π/2 – вертикально вгору);
-    level   – рівень рекурсії (0 – більше гілок немає).
+    level   – кількість рівнів гілок (0 – гілок немає).
+
+    На кожному рівні для всіх гілок одночасно:
+    - обчислюємо кінці поточних гілок;
+    - кожна гілка породжує дві дочірні довжиною length * sqrt(2) / 2,
+      повернуті на ±45° відносно неї.
 
-    На кожному кроці:
-    - малюємо відрізок поточної гілки;
-    - створюємо дві дочірні гілки довжиною length * sqrt(2) / 2;
-    - повертаємо їх на ±45° відносно поточної гілки.
+    :return: Масив форми (N, 2, 2) – пари точок (початок, кінець) кожної гілки.
     """
-    if level == 0:
-        return
+    if level <= 0:
+        return np.empty((0, 2, 2))
 
-    # Кінець поточної гілки
-    x2 = x + length * np.cos(angle)
-    y2 = y + length * np.sin(angle)
+    xs = np.array([x], dtype=np.float64)
+    ys = np.array([y], dtype=np.float64)
+    angles = np.array([angle], dtype=np.float64)
+    scale = np.sqrt(2) / 2
 
-    # Малюємо саму гілку
-    ax.plot([x, x2], [y, y2], color=COLOR, linewidth=1.0)
+    segments: list[np.ndarray] = []
+    for _ in range(level):
+        # Кінці поточних гілок
+        x2 = xs + length * np.cos(angles)
+        y2 = ys + length * np.sin(angles)
+        segments.append(np.stack([np.stack([xs, ys], axis=1), np.stack([x2, y2], axis=1)], axis=1))
 
-    # Нова довжина відповідно до класичного дерева Піфагора
-    new_length = length * np.sqrt(2) / 2
+        # Дві нові гілки з кінця кожної поточної під кутами ±45°
+        xs = np.repeat(x2, 2)
+        ys = np.repeat(y2, 2)
+        angles = np.stack([angles + np.pi / 4, angles - np.pi / 4], axis=1).ravel()
+        length *= scale
 
-    # Дві нові гілки під кутами ±45°
-    left_angle = angle + np.pi / 4
-    right_angle = angle - np.pi / 4
+    return np.concatenate(segments)
 
-    draw_branch(ax, x2, y2, new_length, left_angle, level - 1)
-    draw_branch(ax, x2, y2, new_length, right_angle, level - 1)
+
+def draw_branch(
+    ax: plt.Axes,
+    x: float,
+    y: float,
+    length: float,
+    angle: float,
+    level: int,
+) -> None:
+    """
+    Малює дерево Піфагора у вигляді ліній однією колекцією LineCollection.
+    Параметри ті самі, що й у build_branch_segments.
+    """
+    segments = build_branch_segments(x, y, length, angle, level)
+    ax.add_collection(LineCollection(segments, colors=COLOR, linewidths=1.0))
+    ax.autoscale_view()
 
 
 def build_and_show_tree(level: int) -> None:
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-import uuid
+import itertools
 import random
 import heapq
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Tuple, List
 
-import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import cm
+from matplotlib.collections import LineCollection
 
 
-@dataclass
+# Лічильник для унікальних id вузлів: для візуалізації потрібна лише їхня унікальність
+_id_counter = itertools.count()
+
+
+@dataclass(slots=True)
 class Node:
     """
     Вузол бінарного дерева, яке використовується для візуалізації.
@@ -27,67 +32,71 @@ class Node:
     color: str = "skyblue"
     left: Optional["Node"] = None
     right: Optional["Node"] = None
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: f"n{next(_id_counter)}")
 
 
 def add_edges(
-    graph: nx.DiGraph,
     node: Optional[Node],
     pos: Dict[str, Tuple[float, float]],
     x: float = 0.0,
     y: float = 0.0,
     layer: int = 1,
-) -> nx.DiGraph:
+) -> Tuple[List[Tuple[str, Dict[str, str]]], List[Tuple[str, str]]]:
     """
-    Рекурсивно додає вузли та ребра до графа для подальшої візуалізації.
+    Ітеративно (зі стеком, без рекурсії) обходить дерево і збирає вузли та ребра
+    для подальшої візуалізації, заповнюючи pos координатами дочірніх вузлів.
 
-    :param graph: Орієнтований граф networkx.
-    :param node: Поточний вузол дерева.
+    :param node: Корінь (під)дерева.
     :param pos: Словник позицій для кожного вузла (id -> (x, y)).
-    :param x: Поточна x-координата.
-    :param y: Поточна y-координата.
+    :param x: x-координата кореня.
+    :param y: y-координата кореня.
     :param layer: Номер шару (глибина), використовується для горизонтального рознесення вузлів.
+    :return: Кортеж (nodes, edges): nodes – список (id, {"color", "label"}) у порядку обходу,
+             edges – список пар (id батька, id дитини).
     """
-    if node is not None:
-        label = f"{node.value}\n[{node.index}]"
-        graph.add_node(node.id, color=node.color, label=label)
+    if node is None:
+        return [], []
+
+    nodes: List[Tuple[str, Dict[str, str]]] = []
+    edges: List[Tuple[str, str]] = []
+    # Елементи стеку: (вузол, x, y, горизонтальний зсув дітей = 1 / 2**layer)
+    stack: List[Tuple[Node, float, float, float]] = [(node, x, y, 1 / 2**layer)]
 
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            left_x = x - 1 / 2**layer
-            pos[node.left.id] = (left_x, y - 1)
-            add_edges(graph, node.left, pos, x=left_x, y=y - 1, layer=layer + 1)
+    while stack:
+        current, cx, cy, step = stack.pop()
+        label = f"{current.value}\n[{current.index}]"
+        nodes.append((current.id, {"color": current.color, "label": label}))
 
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            right_x = x + 1 / 2**layer
-            pos[node.right.id] = (right_x, y - 1)
-            add_edges(graph, node.right, pos, x=right_x, y=y - 1, layer=layer + 1)
+        # Правого кладемо першим, щоб ліве піддерево оброблялося раніше (як у рекурсії)
+        for child, child_x in ((current.right, cx + step), (current.left, cx - step)):
+            if child:
+                edges.append((current.id, child.id))
+                pos[child.id] = (child_x, cy - 1)
+                stack.append((child, child_x, cy - 1, step / 2))
 
-    return graph
+    return nodes, edges
 
 
 def draw_tree(tree_root: Node, title: str = "") -> None:
     """
-    Відображає дерево, коренем якого є tree_root, за допомогою networkx + matplotlib.
+    Відображає дерево, коренем якого є tree_root, за допомогою matplotlib
     """
-    tree = nx.DiGraph()
     pos: Dict[str, Tuple[float, float]] = {tree_root.id: (0.0, 0.0)}
-    tree = add_edges(tree, tree_root, pos)
-
-    colors = [node_data["color"] for _, node_data in tree.nodes(data=True)]
-    labels = {node_id: node_data["label"] for node_id, node_data in tree.nodes(data=True)}
-
-    plt.figure(figsize=(10, 6))
-    nx.draw(
-        tree,
-        pos=pos,
-        labels=labels,
-        arrows=False,
-        node_size=2500,
-        node_color=colors,
-        font_size=9,
-    )
+    node_data, edges = add_edges(tree_root, pos)
+
+    xs = [pos[node_id][0] for node_id, _ in node_data]
+    ys = [pos[node_id][1] for node_id, _ in node_data]
+    colors = [data["color"] for _, data in node_data]
+    segments = [(pos[src], pos[dst]) for src, dst in edges]
+
+    # Малюємо напряму через matplotlib: усі ребра – однією колекцією, усі вузли – одним scatter
+    _, ax = plt.subplots(figsize=(10, 6))
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=1.0, zorder=1))
+    ax.scatter(xs, ys, s=2500, c=colors, zorder=2)
+    for (_, data), x, y in zip(node_data, xs, ys):
+        ax.text(x, y, data["label"], fontsize=9, ha="center", va="center", zorder=3)
+    ax.margins(0.1)
+
     if title:
         plt.title(title)
     plt.axis("off")
@@ -116,54 +125,45 @@ def build_heap_tree(heap: List[int]) -> Optional[Node]:
     for i, value in enumerate(heap):
         nodes[i] = Node(value=value, index=i)
 
-    for i in range(len(heap)):
+    # Діти є лише у перших n // 2 вузлів, і для них лівий індекс завжди < n
+    n = len(heap)
+    for i in range(n // 2):
         left_index = 2 * i + 1
-        right_index = 2 * i + 2
+        right_index = left_index + 1
 
-        if left_index < len(heap):
-            nodes[i].left = nodes[left_index]  # type: ignore[index]
-        if right_index < len(heap):
-            nodes[i].right = nodes[right_index]  # type: ignore[index]
+        nodes[i].left = nodes[left_index]  # type: ignore[union-attr]
+        if right_index < n:
+            nodes[i].right = nodes[right_index]  # type: ignore[union-attr]
 
-    root = nodes[0]
-    assign_colors_by_depth(root)
-    return root
+    assign_colors_by_heap_index(nodes)  # type: ignore[arg-type]
+    return nodes[0]
 
 
-def assign_colors_by_depth(root: Optional[Node]) -> None:
+def assign_colors_by_heap_index(nodes: List[Node]) -> None:
     """
-    Призначає кольори вузлам залежно від їхньої глибини в дереві:
-    корінь темніший, листки – світліші.
+    Призначає кольори вузлам, що лежать у порядку масиву купи, залежно від їхньої
+    глибини в дереві: корінь темніший, листки – світліші (colormap 'Blues').
 
-    Використовуємо colormap 'Blues' для наочності.
+    Глибина вузла з індексом i у купі – це (i + 1).bit_length() - 1,
+    тому BFS по дереву не потрібен.
     """
-    if root is None:
+    if not nodes:
         return
 
-    # BFS, щоб зібрати вузли по рівнях
-    levels: Dict[int, List[Node]] = {}
-    queue: List[Tuple[Node, int]] = [(root, 0)]
-
-    max_level = 0
-    while queue:
-        node, level = queue.pop(0)
-        levels.setdefault(level, []).append(node)
-        max_level = max(max_level, level)
+    palette = _level_palette(len(nodes).bit_length() - 1)
+    for i, node in enumerate(nodes):
+        node.color = palette[(i + 1).bit_length() - 1]
 
-        if node.left:
-            queue.append((node.left, level + 1))
-        if node.right:
-            queue.append((node.right, level + 1))
 
-    # Призначаємо кольори: чим глибше рівень, тим світліший відтінок
-    for level, nodes in levels.items():
-        # t від 0 (корінь) до 1 (найнижчий рівень)
-        t = level / max_level if max_level > 0 else 0.0
-        color_rgba = cm.Blues(0.3 + 0.7 * t)  # трішки зсунутий діапазон, щоб кольори були виразні
-        # Перетворюємо RGBA у hex для сумісності з matplotlib/networkx
-        hex_color = _rgba_to_hex(color_rgba)
-        for node in nodes:
-            node.color = hex_color
+def _level_palette(max_level: int) -> List[str]:
+    """
+    Повертає hex-кольори для рівнів 0..max_level одним викликом colormap 'Blues'.
+    """
+    # t від 0 (корінь) до 1 (найнижчий рівень)
+    t = np.linspace(0.0, 1.0, max_level + 1)
+    rgba = cm.Blues(0.3 + 0.7 * t)  # трішки зсунутий діапазон, щоб кольори були виразні
+    # Перетворюємо RGBA у hex для сумісності з matplotlib
+    return [_rgba_to_hex(tuple(color)) for color in rgba]
 
 
 def _rgba_to_hex(rgba: Tuple[float, float, float, float]) -> str:
@@ -232,6 +232,13 @@ def _run_simple_tests() -> None:
     assert root.right.left is not None and root.right.left.value == 60
     assert root.right.right is not None and root.right.right.value == 70
 
+    # Перевіряємо кольори: корінь – найтемніший рівень, листки – найсвітліший
+    palette = _level_palette(2)
+    assert root.color == palette[0], "Неправильний колір кореня"
+    assert root.left.color == root.right.color == palette[1], "Неправильний колір другого рівня"
+    leaves = (root.left.left, root.left.right, root.right.left, root.right.right)
+    assert all(leaf.color == palette[2] for leaf in leaves), "Неправильний колір листків"
+
     print("Усі внутрішні тести для побудови дерева з купи пройдено успішно ✅")
 
 
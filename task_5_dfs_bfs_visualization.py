@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-import uuid
+import itertools
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Tuple, List, Iterable
 
 from collections import deque
+from functools import lru_cache
 
-import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 
 # ==========================
 #  Структура даних "Вузол"
 # ==========================
 
-@dataclass
+# Лічильник для унікальних id вузлів: для візуалізації потрібна лише їхня унікальність
+_id_counter = itertools.count()
+
+
+@dataclass(slots=True)
 class Node:
     """
     Вузол бінарного дерева.
@@ -23,13 +29,13 @@ class Node:
     left   – лівий нащадок;
     right  – правий нащадок;
     color  – колір вузла у форматі '#RRGGBB' (за замовчуванням – сине небо);
-    id     – унікальний ідентифікатор для побудови графа (networkx).
+    id     – унікальний ідентифікатор для побудови графа.
     """
     value: int
     left: Optional["Node"] = None
     right: Optional["Node"] = None
     color: str = "#87CEEB"  # skyblue
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: f"n{next(_id_counter)}")
 
 
 # =====================================
@@ -50,12 +56,13 @@ def build_complete_binary_tree(values: Iterable[int]) -> Optional[Node]:
 
     nodes: List[Optional[Node]] = [Node(v) for v in vals]
 
-    for i in range(len(nodes)):
+    # Діти є лише у перших n // 2 вузлів, і для них лівий індекс завжди < n
+    n = len(nodes)
+    for i in range(n // 2):
         left_index = 2 * i + 1
-        right_index = 2 * i + 2
-        if left_index < len(nodes):
-            nodes[i].left = nodes[left_index]
-        if right_index < len(nodes):
+        right_index = left_index + 1
+        nodes[i].left = nodes[left_index]
+        if right_index < n:
             nodes[i].right = nodes[right_index]
 
     return nodes[0]
@@ -66,63 +73,68 @@ def build_complete_binary_tree(values: Iterable[int]) -> Optional[Node]:
 # =====================================
 
 def add_edges(
-    graph: nx.DiGraph,
     node: Optional[Node],
     pos: Dict[str, Tuple[float, float]],
     x: float = 0.0,
     y: float = 0.0,
     layer: int = 1,
-) -> nx.DiGraph:
+) -> Tuple[List[Tuple[str, Dict[str, str]]], List[Tuple[str, str]]]:
     """
-    Рекурсивно додає вузли та ребра до графа для подальшої візуалізації.
+    Ітеративно (зі стеком, без рекурсії) обходить дерево і збирає вузли та ребра
+    для подальшої візуалізації, заповнюючи pos координатами дочірніх вузлів.
 
-    :param graph: Орієнтований граф networkx.
-    :param node: Поточний вузол дерева.
+    :param node: Корінь (під)дерева.
     :param pos: Словник позицій для кожного вузла (id -> (x, y)).
-    :param x: Поточна x-координата.
-    :param y: Поточна y-координата.
+    :param x: x-координата кореня.
+    :param y: y-координата кореня.
     :param layer: Глибина (шар) – використовується для горизонтального рознесення.
+    :return: Кортеж (nodes, edges): nodes – список (id, {"color", "label"}) у порядку обходу,
+             edges – список пар (id батька, id дитини).
     """
-    if node is not None:
-        graph.add_node(node.id, color=node.color, label=str(node.value))
+    if node is None:
+        return [], []
 
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            left_x = x - 1 / 2**layer
-            pos[node.left.id] = (left_x, y - 1)
-            add_edges(graph, node.left, pos, x=left_x, y=y - 1, layer=layer + 1)
+    nodes: List[Tuple[str, Dict[str, str]]] = []
+    edges: List[Tuple[str, str]] = []
+    # Елементи стеку: (вузол, x, y, горизонтальний зсув дітей = 1 / 2**layer)
+    stack: List[Tuple[Node, float, float, float]] = [(node, x, y, 1 / 2**layer)]
 
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            right_x = x + 1 / 2**layer
-            pos[node.right.id] = (right_x, y - 1)
-            add_edges(graph, node.right, pos, x=right_x, y=y - 1, layer=layer + 1)
+    while stack:
+        current, cx, cy, step = stack.pop()
+        label = str(current.value)
+        nodes.append((current.id, {"color": current.color, "label": label}))
 
-    return graph
+        # Правого кладемо першим, щоб ліве піддерево оброблялося раніше (як у рекурсії)
+        for child, child_x in ((current.right, cx + step), (current.left, cx - step)):
+            if child:
+                edges.append((current.id, child.id))
+                pos[child.id] = (child_x, cy - 1)
+                stack.append((child, child_x, cy - 1, step / 2))
+
+    return nodes, edges
 
 
 def draw_tree(tree_root: Node, title: str = "") -> None:
     """
-    Відображає дерево, коренем якого є tree_root, за допомогою networkx + matplotlib.
+    Відображає дерево, коренем якого є tree_root, за допомогою matplotlib
     Використовує кольори, які вже записані у node.color.
     """
-    tree = nx.DiGraph()
     pos: Dict[str, Tuple[float, float]] = {tree_root.id: (0.0, 0.0)}
-    add_edges(tree, tree_root, pos)
-
-    colors = [node_data["color"] for _, node_data in tree.nodes(data=True)]
-    labels = {node_id: node_data["label"] for node_id, node_data in tree.nodes(data=True)}
-
-    plt.figure(figsize=(10, 6))
-    nx.draw(
-        tree,
-        pos=pos,
-        labels=labels,
-        arrows=False,
-        node_size=2500,
-        node_color=colors,
-        font_size=9,
-    )
+    node_data, edges = add_edges(tree_root, pos)
+
+    xs = [pos[node_id][0] for node_id, _ in node_data]
+    ys = [pos[node_id][1] for node_id, _ in node_data]
+    colors = [data["color"] for _, data in node_data]
+    segments = [(pos[src], pos[dst]) for src, dst in edges]
+
+    # Малюємо напряму через matplotlib: усі ребра – однією колекцією, усі вузли – одним scatter
+    _, ax = plt.subplots(figsize=(10, 6))
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=1.0, zorder=1))
+    ax.scatter(xs, ys, s=2500, c=colors, zorder=2)
+    for (_, data), x, y in zip(node_data, xs, ys):
+        ax.text(x, y, data["label"], fontsize=9, ha="center", va="center", zorder=3)
+    ax.margins(0.1)
+
     if title:
         plt.title(title)
     plt.axis("off")
@@ -134,37 +146,37 @@ def draw_tree(tree_root: Node, title: str = "") -> None:
 #  Генерація кольорового градієнта
 # =====================================
 
-def generate_color_gradient_hex(n: int, start_color: str = "#002147", end_color: str = "#99CCFF") -> List[str]:
+@lru_cache(maxsize=256)
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Перетворює hex-рядок '#RRGGBB' у кортеж (r, g, b)."""
+    hex_color = hex_color.lstrip("#")
+    return int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+
+
+@lru_cache(maxsize=128)
+def generate_color_gradient_hex(n: int, start_color: str = "#002147", end_color: str = "#99CCFF") -> Tuple[str, ...]:
     """
-    Генерує список з n кольорів у форматі '#RRGGBB',
+    Генерує кортеж з n кольорів у форматі '#RRGGBB',
     плавно змінюючись від start_color (темніший) до end_color (світліший).
 
+    Канали інтерполюються векторно (NumPy). Результат незмінний (кортеж),
+    тому кешується: демонстрації багато разів запитують той самий градієнт.
+
     :param n: Кількість кольорів.
     :param start_color: Початковий колір у hex.
     :param end_color: Кінцевий колір у hex.
     """
     if n <= 0:
-        return []
+        return ()
+    if start_color == end_color:
+        return (start_color,) * n
 
-    def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-        hex_color = hex_color.lstrip("#")
-        return int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+    start = np.array(hex_to_rgb(start_color), dtype=np.float64)
+    end = np.array(hex_to_rgb(end_color), dtype=np.float64)
 
-    def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
-        r, g, b = rgb
-        return "#{:02X}{:02X}{:02X}".format(r, g, b)
-
-    start_r, start_g, start_b = hex_to_rgb(start_color)
-    end_r, end_g, end_b = hex_to_rgb(end_color)
-
-    colors: List[str] = []
-    for i in range(n):
-        t = i / max(1, n - 1)  # від 0 до 1
-        r = int(start_r + (end_r - start_r) * t)
-        g = int(start_g + (end_g - start_g) * t)
-        b = int(start_b + (end_b - start_b) * t)
-        colors.append(rgb_to_hex((r, g, b)))
-    return colors
+    # Рядок i – колір для кроку i; всі три канали інтерполюються одночасно
+    rgb = np.linspace(start, end, n).round().astype(np.uint8)
+    return tuple(f"#{r:02X}{g:02X}{b:02X}" for r, g, b in rgb.tolist())
 
 
 # =====================================
@@ -209,13 +221,18 @@ def traverse_bfs(root: Optional[Node]) -> List[Node]:
     order: List[Node] = []
     queue: deque[Node] = deque([root])
 
+    # Локальні посилання на методи, щоб не шукати їх атрибутами на кожній ітерації
+    visit = order.append
+    pop = queue.popleft
+    push = queue.append
+
     while queue:
-        node = queue.popleft()
-        order.append(node)
+        node = pop()
+        visit(node)
         if node.left:
-            queue.append(node.left)
+            push(node.left)
         if node.right:
-            queue.append(node.right)
+            push(node.right)
 
     return order
 
@@ -279,14 +296,13 @@ def demo_traversal(traversal_type: str, step_by_step: bool = False) -> None:
     print(" -> ".join(str(node.value) for node in order))
 
     if step_by_step:
-        # Покрокова візуалізація: на кожному кроці фарбуємо
-        # всі вже відвідані вузли, показуємо дерево, чекаємо Enter.
+        # Покрокова візуалізація: на кожному кроці фарбуємо щойно
+        # відвіданий вузол, показуємо дерево, чекаємо Enter.
         print("\nРежим покрокової візуалізації. Натискайте Enter для переходу до наступного кроку.")
         colors = generate_color_gradient_hex(len(order), "#002147", "#99CCFF")
         for i, node in enumerate(order):
-            # Фарбуємо всі вузли до поточного включно
-            for j in range(i + 1):
-                order[j].color = colors[j]
+            # Попередні вузли вже пофарбовані на минулих кроках – фарбуємо лише поточний
+            node.color = colors[i]
             step_title = f"{title_base}: крок {i + 1} / {len(order)} (відвідано вузол {node.value})"
             draw_tree(root, title=step_title)
             if i < len(order) - 1:
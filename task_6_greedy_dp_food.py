@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 
 # -----------------------
 #   Вхідні дані задачі
@@ -17,6 +20,10 @@ items: Dict[str, Dict[str, int]] = {
     "potato": {"cost": 25, "calories": 350},
 }
 
+# Вартість і калорійність страв основного меню як пласкі словники (одне звернення замість двох)
+_COST: Dict[str, int] = {name: data["cost"] for name, data in items.items()}
+_CAL: Dict[str, int] = {name: data["calories"] for name, data in items.items()}
+
 
 @dataclass
 class SelectionResult:
@@ -30,6 +37,25 @@ class SelectionResult:
 #   Жадібний алгоритм (greedy_algorithm)
 # -----------------------------------------
 
+Menu = Tuple[Tuple[str, int, int], ...]
+
+
+def _menu_key(food_items: Dict[str, Dict[str, int]]) -> Menu:
+    """Хешоване представлення меню: кортеж (назва, cost, calories)."""
+    return tuple((name, data["cost"], data["calories"]) for name, data in food_items.items())
+
+
+@lru_cache(maxsize=128)
+def _ratio_order(menu: Menu) -> Menu:
+    """
+    Страви меню у порядку спадання ratio = calories / cost.
+    Результат кешується, тож для того самого меню сортування виконується лише раз.
+    Страви з cost <= 0 пропускаються (захист від ділення на нуль/некоректних даних).
+    """
+    valid = (item for item in menu if item[1] > 0)
+    return tuple(sorted(valid, key=lambda item: item[2] / item[1], reverse=True))
+
+
 def greedy_algorithm(
     food_items: Dict[str, Dict[str, int]],
     budget: int,
@@ -39,32 +65,18 @@ def greedy_algorithm(
     Ідея: максимізувати співвідношення калорій / вартість.
 
     1. Рахуємо ratio = calories / cost для кожної страви.
-    2. Сортуємо страви за ratio у спадному порядку.
+    2. Сортуємо страви за ratio у спадному порядку (порядок кешується для того самого меню).
     3. Ідемо по списку, поки дозволяє бюджет.
 
     :param food_items: Словник страв: назва -> {"cost": int, "calories": int}
     :param budget: Доступний бюджет.
     :return: SelectionResult – список обраних страв, сумарна вартість, сумарна калорійність.
     """
-    # Формуємо список (назва, cost, calories, ratio)
-    scored: List[Tuple[str, int, int, float]] = []
-    for name, data in food_items.items():
-        cost = data["cost"]
-        calories = data["calories"]
-        if cost <= 0:
-            # Захист від ділення на нуль/некоректних даних
-            continue
-        ratio = calories / cost
-        scored.append((name, cost, calories, ratio))
-
-    # Сортуємо за ratio (від більшого до меншого)
-    scored.sort(key=lambda x: x[3], reverse=True)
-
     chosen: List[str] = []
     total_cost = 0
     total_calories = 0
 
-    for name, cost, calories, ratio in scored:
+    for name, cost, calories in _ratio_order(_menu_key(food_items)):
         if total_cost + cost <= budget:
             chosen.append(name)
             total_cost += cost
@@ -79,6 +91,26 @@ def greedy_algorithm(
 #   не більше одного разу.
 # ----------------------------------------------------
 
+def _knapsack_dp(costs: List[int], calories: List[int], budget: int) -> np.ndarray:
+    """
+    Прямий прохід ДП "рюкзак 0/1" для заданих страв.
+
+    :return: Масив dp довжини budget + 1, де dp[w] – максимальні калорії при бюджеті w.
+    """
+    dp = np.zeros(budget + 1, dtype=np.int64)
+
+    for cost, cal in zip(costs, calories):
+        if cost > budget:
+            continue
+
+        # Оновлюємо всі бюджети w >= cost одночасно. Сума dp[:-cost] + cal обчислюється
+        # в окремий тимчасовий масив зі СТАРИХ значень dp ще до запису, тому кожну страву
+        # використано не більше одного разу (як при зворотному проході по w).
+        np.maximum(dp[cost:], dp[: budget + 1 - cost] + cal, out=dp[cost:])
+
+    return dp
+
+
 def dynamic_programming(
     food_items: Dict[str, Dict[str, int]],
     budget: int,
@@ -95,46 +127,51 @@ def dynamic_programming(
     Використовуємо 1-вимірний масив dp:
         dp[w] – максимальна калорійність при бюджеті w.
 
-    Додатково зберігаємо інформацію про те, які страви були взяті,
-    щоб відновити оптимальний набір.
+    Оптимальний набір відновлюємо, порівнюючи dp для префіксів списку страв.
 
     :param food_items: Словник страв: назва -> {"cost": int, "calories": int}
     :param budget: Максимальний бюджет.
     :return: SelectionResult – оптимальний набір страв.
     """
-    names = list(food_items.keys())
-    n = len(names)
+    chosen, total_cost, total_calories = _solve_knapsack(_menu_key(food_items), budget)
+    return SelectionResult(list(chosen), total_cost, total_calories)
 
-    # dp[w] – максимальні калорії при бюджеті w
-    dp = [0] * (budget + 1)
-    # keep[i][w] – брали ми i-ту страву (по списку names) при бюджеті w чи ні
-    keep: List[List[bool]] = [[False] * (budget + 1) for _ in range(n)]
 
-    for i, name in enumerate(names):
-        cost = food_items[name]["cost"]
-        calories = food_items[name]["calories"]
+@lru_cache(maxsize=256)
+def _solve_knapsack(menu: Menu, budget: int) -> Tuple[Tuple[str, ...], int, int]:
+    """
+    Розв'язок "рюкзака 0/1" для конкретного меню та бюджету.
+    Результат кешується, тож повторні запити (наприклад, перебір бюджетів для того самого меню)
+    не перераховують ДП.
 
-        # Ітеруємось по бюджету "назад", щоб кожну страву використати не більше одного разу
-        for w in range(budget, cost - 1, -1):
-            if dp[w - cost] + calories > dp[w]:
-                dp[w] = dp[w - cost] + calories
-                keep[i][w] = True
+    :return: Кортеж (назви обраних страв, сумарна вартість, сумарна калорійність).
+    """
+    names = [name for name, _, _ in menu]
+    costs = [cost for _, cost, _ in menu]
+    calories = [cal for _, _, cal in menu]
+    n = len(menu)
+
+    dp = _knapsack_dp(costs, calories, budget)
 
-    # Відновлюємо набір страв
+    # Відновлюємо набір страв без окремої таблиці keep: i-ту страву брали при бюджеті w
+    # тоді й лише тоді, коли dp для перших i+1 страв відрізняється від dp для перших i.
+    # Страв мало, тому повторний прохід ДП для кожного префікса дешевий, а пам'ять – O(budget).
     chosen: List[str] = []
+    total_cost = 0
+    total_calories = 0
     w = budget
     for i in range(n - 1, -1, -1):
-        if keep[i][w]:
-            name = names[i]
-            chosen.append(name)
-            w -= food_items[name]["cost"]
+        dp_prev = _knapsack_dp(costs[:i], calories[:i], budget)
+        if dp[w] != dp_prev[w]:
+            chosen.append(names[i])
+            w -= costs[i]
+            total_cost += costs[i]
+            total_calories += calories[i]
+        dp = dp_prev
 
     chosen.reverse()
 
-    total_cost = sum(food_items[name]["cost"] for name in chosen)
-    total_calories = sum(food_items[name]["calories"] for name in chosen)
-
-    return SelectionResult(chosen, total_cost, total_calories)
+    return tuple(chosen), total_cost, total_calories
 
 
 # -----------------------------
@@ -154,8 +191,8 @@ def print_selection(title: str, result: SelectionResult) -> None:
     print(f"{'Страва':<12} | {'Вартість':>8} | {'Калорії':>9}")
     print("-" * 36)
     for name in result.items:
-        cost = items[name]["cost"]
-        calories = items[name]["calories"]
+        cost = _COST[name]
+        calories = _CAL[name]
         print(f"{name:<12} | {cost:>8} | {calories:>9}")
     print("-" * 36)
     print(f"Сумарна вартість:  {result.total_cost}")
@@ -211,6 +248,9 @@ def _run_simple_tests() -> None:
 
     # ДП не може бути гіршим за жадібний за калорійністю
     assert dp_mid.total_calories >= g_mid.total_calories
+    # Оптимальний набір для бюджету 60 відомий заздалегідь
+    assert dp_mid.items == ["pepsi", "cola", "potato"], "Неправильний набір страв у DP"
+    assert dp_mid.total_cost == 50 and dp_mid.total_calories == 670
 
     # Тест 3: дуже великий бюджет – можемо взяти всі страви
     budget_big = 1_000
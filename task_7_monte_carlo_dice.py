@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-import random
-from collections import Counter
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import List, Optional
 
 import matplotlib.pyplot as plt
+import numpy as np
+
+
+# Можливі суми на двох кубиках
+TOTALS = np.arange(2, 13)
 
 
 @dataclass
@@ -21,59 +27,94 @@ class ProbabilityTableRow:
 #   Аналітичні ймовірності
 # -----------------------------
 
-def theoretical_probabilities() -> Dict[int, float]:
+# Кількість комбінацій для суми s: 1, 2, ..., 6 (для s = 7), ..., 2, 1 – з 36 можливих.
+# Не залежить ні від чого, тому обчислюється один раз під час імпорту;
+# масив лише для читання, щоб його можна було віддавати без копіювання.
+_THEORETICAL = (6 - np.abs(TOTALS - 7)) / 36
+_THEORETICAL.setflags(write=False)
+
+
+def theoretical_probabilities() -> np.ndarray:
     """
-    Повертає словник {сума: ймовірність} для кидання двох чесних кубиків.
+    Повертає ймовірності сум 2..12 для кидання двох чесних кубиків.
+
+    :return: Масив довжини 11 (лише для читання), де елемент i – ймовірність суми TOTALS[i].
     """
-    combinations_count = {
-        2: 1,
-        3: 2,
-        4: 3,
-        5: 4,
-        6: 5,
-        7: 6,
-        8: 5,
-        9: 4,
-        10: 3,
-        11: 2,
-        12: 1,
-    }
-    total_outcomes = 36
-    return {s: c / total_outcomes for s, c in combinations_count.items()}
+    return _THEORETICAL
 
 
 # -----------------------------
 #   Монте-Карло симуляція
 # -----------------------------
 
-def simulate_dice_throws(n_throws: int) -> Counter:
+# Кількість кидків, що генерується за один раз: пакет вміщується в кеш процесора,
+# тож пам'ять не залежить від загальної кількості кидків
+THROWS_PER_CHUNK = 1 << 20
+
+# Менші симуляції виконуються в одному процесі: запуск пулу процесів коштує дорожче
+PARALLEL_MIN_THROWS = 10_000_000
+
+
+def _throw_histogram(n_throws: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Кидає два кубики n_throws разів пакетами по THROWS_PER_CHUNK.
+
+    :return: Масив довжини 13, де елемент з індексом s – кількість появ суми s.
+    """
+    hist = np.zeros(13, dtype=np.int64)
+
+    remaining = n_throws
+    while remaining > 0:
+        size = min(remaining, THROWS_PER_CHUNK)
+        rolls = rng.integers(1, 7, size=(size, 2), dtype=np.int8)
+        hist += np.bincount(rolls.sum(axis=1), minlength=13)
+        remaining -= size
+
+    return hist
+
+
+def _throw_histogram_worker(n_throws: int, seed: np.random.SeedSequence) -> np.ndarray:
+    """Точка входу процесу-воркера: власний незалежний генератор для кожного процесу."""
+    return _throw_histogram(n_throws, np.random.default_rng(seed))
+
+
+def simulate_dice_throws(n_throws: int, workers: Optional[int] = None) -> np.ndarray:
     """
     Імітує n_throws кидків двох кубиків.
 
+    Кидки генеруються векторно генератором NumPy пакетами фіксованого розміру,
+    а суми підраховуються через np.bincount. Для великої кількості кидків
+    (від PARALLEL_MIN_THROWS) робота ділиться між процесами; кожен процес отримує
+    незалежний потік випадкових чисел через SeedSequence.spawn.
+
     :param n_throws: Кількість кидків.
-    :return: Counter, де ключ – сума (2..12), значення – кількість появ цієї суми.
+    :param workers: Кількість процесів (за замовчуванням – кількість ядер).
+    :return: Масив довжини 13, де елемент з індексом s – кількість появ суми s (2..12).
     """
-    counter: Counter = Counter()
-    for _ in range(n_throws):
-        d1 = random.randint(1, 6)
-        d2 = random.randint(1, 6)
-        s = d1 + d2
-        counter[s] += 1
-    return counter
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or n_throws < PARALLEL_MIN_THROWS:
+        hist = _throw_histogram(n_throws, np.random.default_rng())
+    else:
+        seeds = np.random.SeedSequence().spawn(workers)
+        base, extra = divmod(n_throws, workers)
+        sizes = [base + (1 if i < extra else 0) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            hist = sum(pool.map(_throw_histogram_worker, sizes, seeds))
+
+    return hist
 
 
-def empirical_probabilities(counts: Counter, n_throws: int) -> Dict[int, float]:
+def empirical_probabilities(hist: np.ndarray, n_throws: int) -> np.ndarray:
     """
     Обчислює емпіричні ймовірності на основі підрахунку сум.
 
-    :param counts: Counter із кількістю появ кожної суми.
+    :param hist: Гістограма сум із simulate_dice_throws (індекс – сума).
     :param n_throws: Загальна кількість кидків.
-    :return: Словник {сума: емпірична ймовірність}.
+    :return: Масив довжини 11, де елемент i – емпірична ймовірність суми TOTALS[i].
     """
-    probs: Dict[int, float] = {}
-    for total in range(2, 13):
-        probs[total] = counts[total] / n_throws
-    return probs
+    return hist[TOTALS] / n_throws
 
 
 # -----------------------------
@@ -81,24 +122,22 @@ def empirical_probabilities(counts: Counter, n_throws: int) -> Dict[int, float]:
 # -----------------------------
 
 def build_probability_table(
-    theoretical: Dict[int, float],
-    empirical: Dict[int, float],
+    theoretical: np.ndarray,
+    empirical: np.ndarray,
 ) -> List[ProbabilityTableRow]:
     """
     Формує список рядків таблиці для порівняння теоретичних
     та емпіричних ймовірностей.
 
-    :param theoretical: Теоретичні ймовірності.
-    :param empirical: Емпіричні ймовірності.
+    :param theoretical: Теоретичні ймовірності сум TOTALS.
+    :param empirical: Емпіричні ймовірності сум TOTALS.
     :return: Список рядків ProbabilityTableRow.
     """
-    table: List[ProbabilityTableRow] = []
-    for total in range(2, 13):
-        th = theoretical.get(total, 0.0)
-        em = empirical.get(total, 0.0)
-        diff = em - th
-        table.append(ProbabilityTableRow(total, th, em, diff))
-    return table
+    differences = empirical - theoretical
+    return [
+        ProbabilityTableRow(int(total), float(th), float(em), float(diff))
+        for total, th, em, diff in zip(TOTALS, theoretical, empirical, differences)
+    ]
 
 
 def print_probability_table(table: List[ProbabilityTableRow]) -> None:
@@ -111,22 +150,29 @@ def print_probability_table(table: List[ProbabilityTableRow]) -> None:
         - Емпірична ймовірність
         - Різниця (Empirical - Theoretical)
     """
-    print("\nТаблиця порівняння теоретичних та емпіричних ймовірностей:")
-    print("-" * 70)
-    print(f"{'Сума':<6} | {'Теоретична':>13} | {'Емпірична':>11} | {'Різниця':>10}")
-    print("-" * 70)
+    # Збираємо всі рядки й виводимо їх одним записом замість print на кожен рядок
+    separator = "-" * 70
+    lines = [
+        "",
+        "Таблиця порівняння теоретичних та емпіричних ймовірностей:",
+        separator,
+        f"{'Сума':<6} | {'Теоретична':>13} | {'Емпірична':>11} | {'Різниця':>10}",
+        separator,
+    ]
     for row in table:
-        print(
+        lines.append(
             f"{row.total:<6} | "
             f"{row.theoretical_prob:>13.4f} | "
             f"{row.empirical_prob:>11.4f} | "
             f"{row.difference:>10.4f}"
         )
-    print("-" * 70)
+    lines.append(separator)
 
     # Додадкова зведена інформація «понад вимоги»
-    avg_abs_diff = sum(abs(r.difference) for r in table) / len(table)
-    print(f"Середнє модульне відхилення емпіричних ймовірностей від теоретичних: {avg_abs_diff:.4f}")
+    avg_abs_diff = float(np.mean(np.abs([r.difference for r in table])))
+    lines.append(f"Середнє модульне відхилення емпіричних ймовірностей від теоретичних: {avg_abs_diff:.4f}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # -----------------------------
@@ -172,16 +218,21 @@ def _run_simple_tests() -> None:
 
     th = theoretical_probabilities()
     # Сума теоретичних ймовірностей повинна бути 1
-    total_th = sum(th.values())
+    total_th = th.sum()
     assert abs(total_th - 1.0) < 1e-9, "Сума теоретичних ймовірностей повинна дорівнювати 1"
 
     # Маленька симуляція – емпіричні ймовірності мають бути «близько» до 1 у сумі
     n_test = 1000
-    counts_test = simulate_dice_throws(n_test)
-    emp_test = empirical_probabilities(counts_test, n_test)
-    total_emp = sum(emp_test.values())
+    hist_test = simulate_dice_throws(n_test)
+    assert hist_test.sum() == n_test, "Кількість підрахованих кидків не збігається з n_throws"
+    emp_test = empirical_probabilities(hist_test, n_test)
+    total_emp = emp_test.sum()
     assert abs(total_emp - 1.0) < 1e-9, "Сума емпіричних ймовірностей має бути 1 (з урахуванням усіх сум)"
 
+    # Паралельна гілка (ProcessPoolExecutor): кількість кидків має зберігатися при розбитті на частини
+    hist_parallel = simulate_dice_throws(PARALLEL_MIN_THROWS, workers=2)
+    assert hist_parallel.sum() == PARALLEL_MIN_THROWS, "Паралельна симуляція втратила або додала кидки"
+
     print("Усі внутрішні тести пройдено успішно ✅")
 
 